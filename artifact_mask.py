@@ -9,22 +9,53 @@ Film grain applied BEFORE ASCII (grain is the base layer).
 Pipeline: SD image → grain → artifact score map → variable-opacity ASCII blend → output
 
 Usage:
-  python3 artifact_mask.py <image> [output.png] [--show-map] [--text "words"]
+  python3 artifact_mask.py <image> [output.png] [--show-map] [--text "words"] [--cache]
+
+  --cache  reuse the score map from an <image>.score.b12.npy sidecar (tuning runs)
 """
 
 import sys
 import os
+import functools
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFont
+
+# Rec. 601 luma weights — `rgb @ LUMA` gives perceived luminance in one pass
+LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
 
 
 def compute_gradient_magnitude(gray):
-    """Sobel-like gradient magnitude."""
-    gx = np.zeros_like(gray, dtype=np.float32)
-    gx[:, 1:-1] = gray[:, 2:].astype(np.float32) - gray[:, :-2].astype(np.float32)
-    gy = np.zeros_like(gray, dtype=np.float32)
-    gy[1:-1, :] = gray[2:, :].astype(np.float32) - gray[:-2, :].astype(np.float32)
-    return np.sqrt(gx**2 + gy**2)
+    """Sobel-like gradient magnitude.
+
+    Central differences written straight into the output buffers, then an
+    in-place hypot — two full-size float32 arrays total, no temporaries.
+    """
+    gray = np.asarray(gray, dtype=np.float32)
+    gx = np.zeros_like(gray)
+    np.subtract(gray[:, 2:], gray[:, :-2], out=gx[:, 1:-1])
+    gy = np.zeros_like(gray)
+    np.subtract(gray[2:, :], gray[:-2, :], out=gy[1:-1, :])
+    return np.hypot(gx, gy, out=gx)
+
+
+def gaussian_blur(arr, sigma):
+    """Separable gaussian blur on a 2D float32 array, edges clamped."""
+    r = max(1, int(3 * sigma + 0.5))
+    k = np.exp(-0.5 * (np.arange(-r, r + 1) / sigma) ** 2).astype(np.float32)
+    k /= k.sum()
+    h, w = arr.shape
+    p = np.pad(arr, r, mode="edge")
+    rows = sum(k[i] * p[i:i + h, :] for i in range(2 * r + 1))
+    return sum(k[i] * rows[:, i:i + w] for i in range(2 * r + 1))
+
+
+def resize_map(arr, size):
+    """Bilinear resize of a 2D float map to size=(w, h), staying in float32.
+
+    Goes through a mode "F" image, so there's no uint8 quantization step.
+    """
+    img = Image.fromarray(np.asarray(arr, dtype=np.float32))
+    return np.asarray(img.resize(size, Image.BILINEAR))
 
 
 def compute_artifact_score(img, block_size=12, min_brightness=25):
@@ -41,16 +72,12 @@ def compute_artifact_score(img, block_size=12, min_brightness=25):
     blocks_h = H // block_size
     blocks_w = W // block_size
 
-    # Compute per-block gradient variance and brightness
-    var_map = np.zeros((blocks_h, blocks_w), dtype=np.float32)
-    bright_map = np.zeros((blocks_h, blocks_w), dtype=np.float32)
-
-    for by in range(blocks_h):
-        for bx in range(blocks_w):
-            y0, y1 = by * block_size, (by + 1) * block_size
-            x0, x1 = bx * block_size, (bx + 1) * block_size
-            var_map[by, bx] = np.var(grad[y0:y1, x0:x1])
-            bright_map[by, bx] = np.mean(gray[y0:y1, x0:x1])
+    # Compute per-block gradient variance and brightness in one reduction:
+    # crop to whole blocks, view as (blocks_h, bs, blocks_w, bs), reduce tiles
+    ch, cw = blocks_h * block_size, blocks_w * block_size
+    tiles = (blocks_h, block_size, blocks_w, block_size)
+    var_map = grad[:ch, :cw].reshape(tiles).var(axis=(1, 3), dtype=np.float32)
+    bright_map = gray[:ch, :cw].reshape(tiles).mean(axis=(1, 3), dtype=np.float32)
 
     # Normalize variance to [0, 1] — low variance = high artifact score
     # Use percentile-based normalization for robustness
@@ -72,14 +99,13 @@ def compute_artifact_score(img, block_size=12, min_brightness=25):
     # Dark blocks get 0 score (shadows are not artifacts)
     score_blocks[~lit_mask] = 0.0
 
-    # Upscale to pixel level with bilinear interpolation
-    score_img = Image.fromarray((score_blocks * 255).astype(np.uint8))
-    score_img = score_img.resize((W, H), Image.BILINEAR)
+    # Gaussian blur for smooth transitions (sigma = 1.5 blocks). Done in float32
+    # on the block grid — an approximation of blurring after the bilinear
+    # upscale (not identical), but it touches block_size² fewer pixels
+    score_blocks = gaussian_blur(score_blocks, sigma=1.5)
 
-    # Gaussian blur for smooth transitions (sigma ~ 2 blocks)
-    score_img = score_img.filter(ImageFilter.GaussianBlur(radius=block_size * 1.5))
-
-    score_px = np.array(score_img, dtype=np.float32) / 255.0
+    # Upscale to pixel level with bilinear interpolation
+    score_px = resize_map(score_blocks, (W, H))
 
     # Apply power curve — push low scores lower, keep high scores high
     # This makes clean areas cleaner and artifact areas more visible
@@ -88,24 +114,59 @@ def compute_artifact_score(img, block_size=12, min_brightness=25):
     return score_px
 
 
+def cached_artifact_score(image_path, img, block_size=12):
+    """compute_artifact_score with an <image>.score.b<block_size>.npy sidecar.
+
+    Re-runs on the same image (tuning ascii_max, score_power, words) load the
+    map instead of recomputing it. The sidecar is a miss if the image was
+    modified or replaced after it (ctime catches `cp -p` / `rsync -t`), if it
+    doesn't match the image size, or if it can't be read.
+    """
+    cache_path = f"{image_path}.score.b{block_size}.npy"
+    try:
+        st = os.stat(image_path)
+        if os.path.getmtime(cache_path) > max(st.st_mtime, st.st_ctime):
+            score_map = np.load(cache_path)
+            if score_map.shape == (img.height, img.width):
+                return score_map
+    except (OSError, ValueError):
+        pass  # missing or unreadable sidecar — recompute
+
+    score_map = compute_artifact_score(img, block_size=block_size)
+
+    # Write via temp file + rename so a concurrent run never reads half a file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.save(f, score_map)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # read-only location — just run uncached
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return score_map
+
+
+def film_grain_noise(arr, intensity=22, seed=None):
+    """Shadow-biased gaussian grain for a float32 RGB array (not yet added)."""
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal(arr.shape, dtype=np.float32)
+    luminance = arr @ LUMA
+    shadow_mask = 1.0 - (luminance / 255.0) * 0.4
+    noise *= shadow_mask[:, :, None] * intensity
+    return noise
+
+
 def apply_film_grain(img, intensity=22, seed=None):
     """Film grain with shadow bias."""
     arr = np.array(img, dtype=np.float32)
-    rng = np.random.RandomState(seed)
-    noise = rng.normal(0, intensity, arr.shape).astype(np.float32)
-    luminance = 0.299 * arr[:,:,0] + 0.587 * arr[:,:,1] + 0.114 * arr[:,:,2]
-    shadow_mask = 1.0 - (luminance / 255.0) * 0.4
-    for c in range(3):
-        noise[:,:,c] *= shadow_mask
-    return Image.fromarray(np.clip(arr + noise, 0, 255).astype(np.uint8))
+    arr += film_grain_noise(arr, intensity, seed)
+    np.clip(arr, 0, 255, out=arr)
+    return Image.fromarray(arr.astype(np.uint8))
 
 
-def apply_chromatic_aberration(img, shift=2):
-    """Cheap lens chromatic aberration — shift R and B channels slightly.
-
-    Creates that "shot on a broken camera" look. Shift is in pixels.
-    """
-    arr = np.array(img)
+def shift_channels(arr, shift=2):
+    """Chromatic aberration on an RGB array: R shifts right, B left, G stays."""
     h, w = arr.shape[:2]
     result = np.zeros_like(arr)
     # Red channel shifts right+down, Blue shifts left+up, Green stays
@@ -116,60 +177,100 @@ def apply_chromatic_aberration(img, shift=2):
     # Blue: shift left
     result[:, :w-shift, 2] = arr[:, shift:, 2]
     result[:, w-shift:, 2] = arr[:, w-shift:, 2]
-    return Image.fromarray(result)
+    return result
 
 
-def apply_vignette(img, strength=0.35):
-    """Radial vignette — darkens edges like an old lens.
+def apply_chromatic_aberration(img, shift=2):
+    """Cheap lens chromatic aberration — shift R and B channels slightly.
 
-    strength: 0.0 = no effect, 1.0 = edges go black.
+    Creates that "shot on a broken camera" look. Shift is in pixels.
     """
-    arr = np.array(img, dtype=np.float32)
-    h, w = arr.shape[:2]
+    return Image.fromarray(shift_channels(np.array(img), shift))
+
+
+def vignette_mask(h, w, strength=0.35):
+    """Radial falloff (h, w): 1.0 at center, (1-strength) at corners."""
     cy, cx = h / 2, w / 2
     max_dist = np.sqrt(cx**2 + cy**2)
     Y, X = np.ogrid[:h, :w]
     dist = np.sqrt((X - cx)**2 + (Y - cy)**2) / max_dist
     # Smooth falloff: 1.0 at center, (1-strength) at corners
-    vignette = 1.0 - strength * (dist ** 1.5)
-    for c in range(3):
-        arr[:, :, c] *= vignette
-    return Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8))
+    return (1.0 - strength * (dist ** 1.5)).astype(np.float32)
 
 
-def render_ascii_layer(img, text_fragments, score_map, font_size=11,
-                       charset="techno", bg_level=0.40, brightness_boost=2.8):
-    """Render full ASCII layer. Characters chosen based on artifact score:
-
-    - Low score (clean): standard ASCII char from charset
-    - High score (artifact): micro-Yent text character
+def apply_vignette(img, strength=0.35):
+    """Radial vignette — darkens edges like an old lens.
 
-    Returns the ASCII-rendered image at the original resolution.
+    strength: 0.0 = no effect, 1.0 = edges go black.
     """
-    CHARSETS = {
-        "techno": " .'·:;~=+×*#%@▓█",
-    }
+    arr = np.array(img, dtype=np.float32)
+    arr *= vignette_mask(arr.shape[0], arr.shape[1], strength)[:, :, None]
+    return Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8))
+
 
-    font = None
+@functools.lru_cache(maxsize=8)
+def _load_font(font_size):
+    """Monospace font for the ASCII layer, PIL's default if none is installed."""
     for fp in ["/System/Library/Fonts/Menlo.ttc",
                "/System/Library/Fonts/Monaco.ttf",
                "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
                "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"]:
         if os.path.exists(fp):
             try:
-                font = ImageFont.truetype(fp, font_size)
-                break
+                return ImageFont.truetype(fp, font_size)
             except Exception:
                 continue
-    if font is None:
-        font = ImageFont.load_default()
+    return ImageFont.load_default()
+
 
+@functools.lru_cache(maxsize=32)
+def _glyph_atlas(font_size, glyphs):
+    """Rasterize each glyph once as a coverage mask the size of one cell.
+
+    Returns (char_w, char_h, masks) where masks is float32
+    (len(glyphs) + 1, char_h, char_w) in [0, 1]: masks[0] is blank (space),
+    masks[i + 1] is glyphs[i]. Cached per (font_size, glyphs) so repeated
+    renders skip font setup.
+    """
+    font = _load_font(font_size)
     char_w = font.getbbox("█")[2]
     char_h = font_size + 3
 
+    masks = np.zeros((len(glyphs) + 1, char_h, char_w), dtype=np.float32)
+    for i, ch in enumerate(glyphs, start=1):
+        mask = Image.new("L", (char_w, char_h), 0)
+        ImageDraw.Draw(mask).text((0, 0), ch, fill=255, font=font)
+        masks[i] = np.array(mask, dtype=np.float32) / 255.0
+    masks.flags.writeable = False
+    return char_w, char_h, masks
+
+
+def render_ascii_layer(img, text_fragments, score_map, font_size=11,
+                       charset="techno", bg_level=0.40, brightness_boost=2.8,
+                       alpha_map=None):
+    """Render full ASCII layer. Characters chosen based on artifact score:
+
+    - Low score (clean): standard ASCII char from charset
+    - High score (artifact): micro-Yent text character
+
+    Returns the ASCII-rendered image at the original resolution. If alpha_map
+    (float opacity in [0, 1], any resolution) is given, it is resized onto
+    the layer and the image is RGBA, ready for Image.alpha_composite.
+    """
+    CHARSETS = {
+        "techno": " .'·:;~=+×*#%@▓█",
+    }
+
     chars = CHARSETS.get(charset, charset)
     num_chars = len(chars)
 
+    # Text stream
+    all_text = " ".join(text_fragments) if text_fragments else "void noise static"
+
+    # Cell size + coverage mask of every glyph, shared across calls
+    glyphs = "".join(sorted(set(chars + all_text) - {" "}))
+    char_w, char_h, glyph_masks = _glyph_atlas(font_size, glyphs)
+
     src_w, src_h = img.size
     cols = src_w // char_w
     rows = src_h // char_h
@@ -182,65 +283,68 @@ def render_ascii_layer(img, text_fragments, score_map, font_size=11,
     pixels = np.array(resized)
 
     # Downsample score map to grid
-    score_grid = np.array(
-        Image.fromarray((score_map * 255).astype(np.uint8)).resize((cols, rows), Image.BILINEAR)
-    ).astype(np.float32) / 255.0
-
-    # Text stream
-    all_text = " ".join(text_fragments) if text_fragments else "void noise static"
-    text_pos = 0
-
+    score_grid = resize_map(score_map, (cols, rows))
+
+    # Per-cell brightness, charset index and colors for the whole grid at once
+    br_grid = (pixels @ LUMA) / 255.0
+    char_idx = np.clip((br_grid * (num_chars - 1)).astype(np.int32), 0, num_chars - 1)
+    is_art = score_grid > 0.4
+
+    # Choose character based on score — clean zone: standard ASCII by
+    # brightness; artifact zone: next char of the Yent text, consumed in
+    # row-major order by artifact cells only. Cells hold atlas indices.
+    atlas_idx = {ch: i for i, ch in enumerate(" " + glyphs)}
+    text_ids = np.array([atlas_idx[ch] for ch in all_text])
+    chars_ids = np.array([atlas_idx[ch] for ch in chars])
+    glyph_grid = chars_ids[char_idx]
+    n_art = int(is_art.sum())
+    if n_art:
+        # Boolean assignment fills artifact cells in row-major order
+        glyph_grid[is_art] = text_ids[np.arange(n_art) % len(all_text)]
+
+    # Color math as 256-entry lookup tables indexed by the uint8 pixel value
+    levels = np.arange(256)
+    bg_lut = np.minimum(255, (levels * bg_level).astype(np.int32)).astype(np.uint8)
+    boost_lut = np.minimum(255, (levels * brightness_boost).astype(np.int32))
+    art_r_lut = np.minimum(255, (boost_lut * 0.75).astype(np.int32)).astype(np.uint8)
+    art_b_lut = np.minimum(255, (boost_lut * 1.2 + 20).astype(np.int32)).astype(np.uint8)
+    boost_lut = boost_lut.astype(np.uint8)
+
+    # Background: tinted cell
+    bg_arr = bg_lut[pixels]
+
+    # Foreground color; artifact zones get a slight blue tint for the text
+    fg_arr = boost_lut[pixels]
+    fg_arr[is_art, 0] = art_r_lut[pixels[is_art, 0]]
+    fg_arr[is_art, 2] = art_b_lut[pixels[is_art, 2]]
+
+    # Cells tile the canvas exactly. Each band of cell rows is one contiguous
+    # canvas slab: gather its glyph masks and alpha-blend bg → fg through
+    # them in a single op. Band height comes from a ~4096-cell budget, so the
+    # float temporaries stay a few MB whatever the canvas width
     out_w = cols * char_w
     out_h = rows * char_h
-    canvas = Image.new("RGB", (out_w, out_h), (8, 8, 12))
-    draw = ImageDraw.Draw(canvas)
-
-    for y in range(rows):
-        for x in range(cols):
-            r, g, b = int(pixels[y, x, 0]), int(pixels[y, x, 1]), int(pixels[y, x, 2])
-            br = (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
-            score = score_grid[y, x]
-
-            px, py = x * char_w, y * char_h
-
-            # Background: tinted cell
-            bg_r = min(255, int(r * bg_level))
-            bg_g = min(255, int(g * bg_level))
-            bg_b = min(255, int(b * bg_level))
-            draw.rectangle([px, py, px + char_w - 1, py + char_h - 1],
-                           fill=(bg_r, bg_g, bg_b))
-
-            # Choose character based on score
-            if score > 0.4:
-                # Artifact zone: use Yent text
-                ch = all_text[text_pos % len(all_text)]
-                text_pos += 1
-            else:
-                # Clean zone: standard ASCII
-                idx = max(0, min(int(br * (num_chars - 1)), num_chars - 1))
-                ch = chars[idx]
-
-            if ch == " ":
-                continue
+    canvas = np.empty((out_h, out_w, 3), dtype=np.uint8)
+    band = max(1, 4096 // cols)
 
-            # Foreground color
-            cr = min(255, int(r * brightness_boost))
-            cg = min(255, int(g * brightness_boost))
-            cb = min(255, int(b * brightness_boost))
+    for y0 in range(0, rows, band):
+        y1 = min(y0 + band, rows)
+        bg = bg_arr[y0:y1, :, None, None, :].astype(np.float32)
+        fg = fg_arr[y0:y1, :, None, None, :].astype(np.float32)
+        cov = glyph_masks[glyph_grid[y0:y1]][..., None]  # (band, cols, char_h, char_w, 1)
+        cells = bg + (fg - bg) * cov + 0.5
+        canvas[y0 * char_h:y1 * char_h] = cells.transpose(0, 2, 1, 3, 4).reshape(-1, out_w, 3)
 
-            # Artifact zones: slight blue tint for the text
-            if score > 0.4:
-                cr = min(255, int(cr * 0.75))
-                cb = min(255, int(cb * 1.2 + 20))
+    if alpha_map is not None:
+        alpha = resize_map(alpha_map, (out_w, out_h)) * 255.0 + 0.5
+        canvas = np.dstack([canvas, np.clip(alpha, 0, 255).astype(np.uint8)])
 
-            draw.text((px, py), ch, fill=(cr, cg, cb), font=font)
-
-    return canvas, (out_w, out_h)
+    return Image.fromarray(canvas), (out_w, out_h)
 
 
 def full_pipeline(image_path, output_path, yent_words=None, block_size=12,
                   font_size=11, grain_intensity=22, show_map=False,
-                  ascii_max=0.90, score_power=3.0):
+                  ascii_max=0.90, score_power=3.0, cache_score=False):
     """Full yent.yo post-processing pipeline.
 
     1. Compute continuous artifact score map
@@ -254,23 +358,25 @@ def full_pipeline(image_path, output_path, yent_words=None, block_size=12,
 
     score_power: higher = sharper cutoff (3.0 means score<0.5 is nearly invisible)
     ascii_max: peak ASCII opacity in worst artifacts
+    cache_score: keep the score map in an <image>.score.b<N>.npy sidecar and
+      reuse it on re-runs (for tuning the same image; leaves a file behind)
     """
     img = Image.open(image_path).convert("RGB")
 
     # Step 1: Artifact score map
-    score_map = compute_artifact_score(img, block_size=block_size)
+    if cache_score:
+        score_map = cached_artifact_score(image_path, img, block_size=block_size)
+    else:
+        score_map = compute_artifact_score(img, block_size=block_size)
     mean_score = score_map.mean()
     high_pct = (score_map > 0.5).sum() / score_map.size * 100
     print(f"  Score: mean={mean_score:.2f}, high-artifact={high_pct:.1f}%", flush=True)
 
     if show_map:
-        h, w = score_map.shape
-        vis = np.zeros((h, w, 3), dtype=np.uint8)
-        vis[:,:,0] = (score_map * 255).astype(np.uint8)
-        vis[:,:,2] = ((1.0 - score_map) * 255).astype(np.uint8)
-        orig = np.array(img.resize((w, h), Image.LANCZOS))
-        blended = (orig.astype(float) * 0.5 + vis.astype(float) * 0.5)
-        Image.fromarray(np.clip(blended, 0, 255).astype(np.uint8)).save(output_path)
+        # Red = artifact, blue = clean; score map is already at image size
+        score_u8 = (score_map * 255).astype(np.uint8)
+        vis = np.dstack([score_u8, np.zeros_like(score_u8), 255 - score_u8])
+        Image.blend(img, Image.fromarray(vis), 0.5).save(output_path)
         print(f"  Score map saved: {output_path}")
         return mean_score
 
@@ -296,16 +402,6 @@ def full_pipeline(image_path, output_path, yent_words=None, block_size=12,
             "i became",
         ]
 
-    # Step 4: Render ASCII layer
-    ascii_layer, (aw, ah) = render_ascii_layer(img, yent_words, score_map,
-                                                font_size=font_size)
-
-    # Step 5: Blend — ASCII ONLY where artifacts live
-    grained_resized = grained.resize((aw, ah), Image.LANCZOS)
-    score_resized = np.array(
-        Image.fromarray((score_map * 255).astype(np.uint8)).resize((aw, ah), Image.BILINEAR)
-    ).astype(np.float32) / 255.0
-
     # Adaptive: if the image is already rich/chaotic (high mean score),
     # pull back the text coverage — don't drown an expressive image
     if mean_score > 0.5:
@@ -319,27 +415,35 @@ def full_pipeline(image_path, output_path, yent_words=None, block_size=12,
     #   score=0.9 → blend=0.67   (strong text)
     #   score=1.0 → blend=0.90   (full Yent words)
     ascii_floor = 0.05
-    blend = ascii_floor + np.power(score_resized, score_power) * (ascii_max - ascii_floor)
-    blend_3ch = np.stack([blend, blend, blend], axis=-1)
+    blend = ascii_floor + np.power(score_map, score_power) * (ascii_max - ascii_floor)
+
+    # Step 4: Render ASCII layer — RGBA, with the blend as its alpha channel
+    ascii_layer, (aw, ah) = render_ascii_layer(img, yent_words, score_map,
+                                                font_size=font_size, alpha_map=blend)
 
-    grained_arr = np.array(grained_resized, dtype=np.float32)
-    ascii_arr = np.array(ascii_layer, dtype=np.float32)
+    # Step 5: Blend — ASCII ONLY where artifacts live
+    grained_resized = grained.resize((aw, ah), Image.LANCZOS)
+    composite_img = Image.alpha_composite(grained_resized.convert("RGBA"), ascii_layer)
+    composite = np.array(composite_img.convert("RGB"), dtype=np.float32)
 
-    composite = grained_arr * (1.0 - blend_3ch) + ascii_arr * blend_3ch
-    composite_img = Image.fromarray(np.clip(composite, 0, 255).astype(np.uint8))
+    # Steps 6-8 stay on the float composite — one clip + uint8 cast at the end
+    # instead of an image round trip per effect
 
     # Step 6: Chromatic aberration — broken camera aesthetic
-    composite_img = apply_chromatic_aberration(composite_img, shift=2)
+    composite = shift_channels(composite, shift=2)
 
     # Step 7: Vignette — dark edges, old lens feel
-    composite_img = apply_vignette(composite_img, strength=0.30)
+    composite *= vignette_mask(ah, aw, strength=0.30)[:, :, None]
 
     # Step 8: Second grain pass — heavier now, bonds the layers + lo-fi finish
-    final = apply_film_grain(composite_img, intensity=int(grain_intensity * 0.7), seed=137)
+    composite += film_grain_noise(composite, intensity=int(grain_intensity * 0.7), seed=137)
+    np.clip(composite, 0, 255, out=composite)
 
+    final = Image.fromarray(composite.astype(np.uint8))
     final.save(output_path)
     sz = os.path.getsize(output_path) // 1024
-    ascii_visible = (blend > 0.1).sum() / blend.size * 100
+    alpha = np.asarray(ascii_layer)[:, :, 3]
+    ascii_visible = (alpha > 0.1 * 255).sum() / alpha.size * 100
     print(f"  ASCII visible: {ascii_visible:.0f}% of image, saved: {output_path} ({sz}KB)",
           flush=True)
     return mean_score
@@ -347,18 +451,21 @@ def full_pipeline(image_path, output_path, yent_words=None, block_size=12,
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python3 artifact_mask.py <image> [output.png] [--show-map] [--text 'w1|w2|w3']")
+        print("Usage: python3 artifact_mask.py <image> [output.png] [--show-map] [--text 'w1|w2|w3'] [--cache]")
         sys.exit(1)
 
     image_path = sys.argv[1]
     output_path = os.path.splitext(image_path)[0] + "_fixed.png"
     show_map = False
+    cache_score = False
     custom_text = None
 
     i = 2
     while i < len(sys.argv):
         if sys.argv[i] == "--show-map":
             show_map = True
+        elif sys.argv[i] == "--cache":
+            cache_score = True
         elif sys.argv[i] == "--text" and i + 1 < len(sys.argv):
             i += 1
             custom_text = sys.argv[i].split("|")
@@ -377,4 +484,4 @@ if __name__ == "__main__":
                 print(f"  Loaded Yent's words from {yent_txt}: {custom_text}")
 
     full_pipeline(image_path, output_path, yent_words=custom_text,
-                  show_map=show_map)
+                  show_map=show_map, cache_score=cache_score)
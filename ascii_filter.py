@@ -202,19 +202,19 @@ def apply_film_grain(image_path, out_path=None, intensity=25, seed=None):
         img = Image.open(image_path).convert("RGB")
 
     arr = np.array(img, dtype=np.float32)
-    rng = np.random.RandomState(seed)
+    rng = np.random.default_rng(seed)
 
-    # Gaussian grain
-    noise = rng.normal(0, intensity, arr.shape).astype(np.float32)
+    # Gaussian grain — drawn directly as float32, no float64 round trip
+    noise = rng.standard_normal(arr.shape, dtype=np.float32)
 
     # Slight luminance bias — grain is stronger in shadows (like real film)
-    luminance = 0.299 * arr[:,:,0] + 0.587 * arr[:,:,1] + 0.114 * arr[:,:,2]
+    luminance = arr @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
     shadow_mask = 1.0 - (luminance / 255.0) * 0.4  # shadows get 1.0x, highlights 0.6x
-    for c in range(3):
-        noise[:,:,c] *= shadow_mask
+    noise *= shadow_mask[:, :, None] * intensity
 
-    result = np.clip(arr + noise, 0, 255).astype(np.uint8)
-    pil_out = Image.fromarray(result)
+    arr += noise
+    np.clip(arr, 0, 255, out=arr)
+    pil_out = Image.fromarray(arr.astype(np.uint8))
 
     if out_path:
         pil_out.save(out_path)